@@ -0,0 +1,128 @@
+"""In-memory response cache for the Pulseway API client."""
+
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    """A cached value with its expiry time and optional ETag validator."""
+
+    expiry: float
+    value: Any
+    etag: Optional[str] = None
+
+
+class TTLCache:
+    """Minimal dict-backed cache whose entries expire after a per-entry TTL.
+
+    Expired entries that carry an ETag are kept so they can be revalidated
+    with a conditional request instead of being downloaded again, but only
+    for ``max_stale`` seconds past their expiry. The cache also holds at most
+    ``max_entries`` entries: once full, stale entries are purged first and
+    then the least recently stored ones, so memory stays bounded even for
+    keys (such as per-system endpoints) that are never requested again.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        max_entries: int = 1024,
+        max_stale: float = 3600.0,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            clock: Monotonic time source in seconds, injectable for tests
+            max_entries: Maximum number of stored entries
+            max_stale: Seconds an expired entry with an ETag is kept for revalidation
+        """
+        self.clock = clock
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self._entries: dict[Hashable, CacheEntry] = {}
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return entry.expiry > self.clock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        entry = self.get_entry(key)
+        if entry is None or not self.is_fresh(entry):
+            return default
+        return entry.value
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get a cache entry, including an expired one that can be revalidated.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if it is missing, or expired and either has no
+            ETag or has been stale for longer than ``max_stale``
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expendable(entry, self.clock()):
+            del self._entries[key]
+            return None
+        return entry
+
+    def set(self, key: Hashable, value: Any, ttl: float, etag: Optional[str] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+            etag: Optional ETag used to revalidate the value once it expires
+        """
+        # Re-insert so dict order tracks how recently each key was stored
+        self._entries.pop(key, None)
+        self._entries[key] = CacheEntry(self.clock() + ttl, value, etag)
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+    def touch(self, key: Hashable, ttl: float) -> None:
+        """Extend the lifetime of an existing entry, e.g. after a 304 response.
+
+        Args:
+            key: Cache key
+            ttl: New time to live in seconds
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._entries[key] = entry._replace(expiry=self.clock() + ttl)
+
+    def _is_expendable(self, entry: CacheEntry, now: float) -> bool:
+        """Whether an entry is expired and no longer worth revalidating."""
+        if entry.expiry > now:
+            return False
+        return entry.etag is None or now - entry.expiry > self.max_stale
+
+    def _evict(self) -> None:
+        """Shrink the cache to ``max_entries``, dropping unusable entries first."""
+        now = self.clock()
+        for key in [k for k, e in self._entries.items() if self._is_expendable(e, now)]:
+            del self._entries[key]
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
@@ -1,13 +1,24 @@
 """Pulseway RMM API client."""
 
+import asyncio
+import functools
 import logging
-from datetime import datetime
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 import httpx
+import ijson
+import orjson
+from pydantic import TypeAdapter
 
+from .cache import CacheEntry, TTLCache
 from .models import (
+    _NOTIF_STATUS,
+    _SYS_STATUS,
     APIError,
+    Metric,
     Notification,
     NotificationStatus,
     Organization,
@@ -20,6 +31,87 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Default cache lifetimes (seconds) for read-mostly endpoints
+ORGANIZATIONS_CACHE_TTL = 600.0
+SYSTEMS_CACHE_TTL = 60.0
+SYSTEM_DETAILS_CACHE_TTL = 30.0
+
+# Bulk validators: one pydantic-core pass per response instead of one per row
+_orgs_adapter = TypeAdapter(list[Organization])
+_systems_adapter = TypeAdapter(list[SystemInfo])
+_notifs_adapter = TypeAdapter(list[Notification])
+
+# Responses smaller than this are decoded in one go instead of streamed
+STREAM_THRESHOLD_BYTES = 64 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 string, memoizing timestamps shared across rows."""
+    return datetime.fromisoformat(value)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat a naive datetime as UTC so it compares with offset-aware ones."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _extract(data: Any, key: str) -> list[Any]:
+    """Return the item list from a response that is either a bare list or ``{key: [...]}``."""
+    # type() rather than isinstance(): JSON objects always decode to plain dicts
+    return data.get(key, []) if type(data) is dict else data  # type: ignore[no-any-return]
+
+
+class _ResponseReader:
+    """Expose an httpx byte stream through the async ``read`` API ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def peek(self) -> bytes:
+        """Return the first non-whitespace byte of the stream without consuming it."""
+        while not self._buffer.lstrip():
+            chunk = await self._next_chunk()
+            if not chunk:
+                return b""
+            self._buffer += chunk
+        return self._buffer.lstrip()[:1]
+
+    async def fill(self, limit: int) -> bool:
+        """Buffer up to ``limit`` bytes; return True if the whole body fit."""
+        chunks = [self._buffer]
+        size = len(self._buffer)
+        while size < limit:
+            chunk = await self._next_chunk()
+            if not chunk:
+                self._buffer = b"".join(chunks)
+                return True
+            chunks.append(chunk)
+            size += len(chunk)
+        self._buffer = b"".join(chunks)
+        return False
+
+    def take(self) -> bytes:
+        """Return and clear everything buffered so far."""
+        data, self._buffer = self._buffer, b""
+        return data
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next chunk of the body, or ``b""`` at the end of the stream."""
+        if size == 0:
+            return b""
+        if self._buffer:
+            data, self._buffer = self._buffer, b""
+            return data
+        return await self._next_chunk()
+
+    async def _next_chunk(self) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
 
 class PulsewayClient:
     """Client for interacting with the Pulseway RMM API."""
@@ -33,40 +125,86 @@ class PulsewayClient:
         self.config = config
         self.base_url = config.server_url.rstrip("/")
         self._client: Optional[httpx.AsyncClient] = None
+        self._close_on_exit = False
+        self._context_depth = 0
+        self._cache = TTLCache()
+        # Encoded once; the config is frozen so the header never changes
+        self._auth_header = (
+            b"authorization",
+            f"Bearer {config.token_id}:{config.token_secret}".encode(),
+        )
 
     async def __aenter__(self) -> "PulsewayClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Bearer {self.config.token_id}:{self.config.token_secret}",
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            },
-            timeout=30.0,
-        )
+        if self._context_depth == 0:
+            self._close_on_exit = self._client is None
+        self._context_depth += 1
+        self._ensure_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        if self._client:
+        """Async context manager exit.
+
+        Only closes the HTTP client when the outermost context exits and that
+        context opened it, so a long-lived instance keeps its connection pool
+        across (possibly nested) ``async with`` blocks.
+        """
+        self._context_depth -= 1
+        if self._context_depth == 0 and self._close_on_exit:
+            await self.aclose()
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Create the underlying HTTP client if it does not exist yet."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=httpx.Headers(
+                    [
+                        self._auth_header,
+                        (b"content-type", b"application/json"),
+                        (b"accept", b"application/json"),
+                    ]
+                ),
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=min(20, self.config.http_pool_size),
+                    max_connections=self.config.http_pool_size,
+                    keepalive_expiry=30.0,
+                ),
+                http2=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        if self._client is not None:
             await self._client.aclose()
+            self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get the HTTP client."""
-        if self._client is None:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        return self._client
+        """Get the HTTP client, creating it on first use."""
+        return self._ensure_client()
+
+    def clear_cache(self) -> None:
+        """Drop all cached API responses."""
+        self._cache.clear()
+
+    def _cache_ttl(self, default: float) -> float:
+        """Resolve the cache TTL for an endpoint, honouring the config override."""
+        if self.config.cache_ttl is None:
+            return default
+        return self.config.cache_ttl
 
     async def _request(
-        self, method: str, endpoint: str, **kwargs: Any
+        self, method: str, endpoint: str, cache_ttl: float = 0.0, **kwargs: Any
     ) -> dict[str, Any] | list[Any]:
         """Make an HTTP request to the Pulseway API.
 
         Args:
             method: HTTP method
             endpoint: API endpoint
+            cache_ttl: Seconds to cache a GET response for (0 disables caching)
             **kwargs: Additional request parameters
 
         Returns:
@@ -75,23 +213,156 @@ class PulsewayClient:
         Raises:
             APIError: If the request fails
         """
+        cache_key = None
+        entry = None
+        if method == "GET" and cache_ttl > 0:
+            cache_key = self._cache_key(endpoint, kwargs.get("params"))
+            entry = self._cache.get_entry(cache_key)
+            if entry is not None:
+                if self._cache.is_fresh(entry):
+                    logger.debug(f"Cache hit for {endpoint}")
+                    return entry.value  # type: ignore[no-any-return]
+                kwargs["headers"] = self._revalidation_headers(entry, kwargs.get("headers"))
+
         url = f"/api/v1{endpoint}"
         logger.debug(f"Making {method} request to {url}")
 
         try:
             response = await self.client.request(method, url, **kwargs)
+            if entry is not None and response.status_code == 304:
+                logger.debug(f"Cached response for {endpoint} revalidated")
+                self._cache.touch(cache_key, cache_ttl)
+                return entry.value  # type: ignore[no-any-return]
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
-            raise APIError(
-                status_code=e.response.status_code,
-                message=str(e),
-                details={"response": e.response.text},
-            )
+            raise self._status_error(e)
         except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
             raise APIError(status_code=0, message=f"Request failed: {e}")
+        except orjson.JSONDecodeError as e:
+            raise self._decode_error(response, e) from e
+
+        if cache_key is not None:
+            self._cache.set(cache_key, data, cache_ttl, response.headers.get("ETag"))
+        return data  # type: ignore[no-any-return]
+
+    async def _stream_items(
+        self,
+        endpoint: str,
+        key: str,
+        cache_ttl: float = 0.0,
+        params: Optional[dict[str, Any]] = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield the items of a list endpoint, streaming large bodies.
+
+        Up to ``STREAM_THRESHOLD_BYTES`` of the body is buffered first. Bodies
+        that end within that are decoded whole and cached (and
+        ETag-revalidated) like ``_request``, with or without a Content-Length.
+        Larger bodies are parsed incrementally with ijson so only one item is
+        held in memory at a time; these are not cached.
+
+        Args:
+            endpoint: API endpoint
+            key: Key holding the item list when the response is an object
+            cache_ttl: Seconds to cache a small response for (0 disables caching)
+            params: Query parameters
+
+        Yields:
+            Raw item dicts
+
+        Raises:
+            APIError: If the request fails
+        """
+        cache_key = None
+        entry = None
+        headers: dict[str, str] = {}
+        if cache_ttl > 0:
+            cache_key = self._cache_key(endpoint, params)
+            entry = self._cache.get_entry(cache_key)
+            if entry is not None:
+                if self._cache.is_fresh(entry):
+                    logger.debug(f"Cache hit for {endpoint}")
+                    for item in _extract(entry.value, key):
+                        yield item
+                    return
+                headers = self._revalidation_headers(entry)
+
+        url = f"/api/v1{endpoint}"
+        logger.debug(f"Streaming GET request to {url}")
+
+        try:
+            async with self.client.stream("GET", url, params=params, headers=headers) as response:
+                if entry is not None and response.status_code == 304:
+                    logger.debug(f"Cached response for {endpoint} revalidated")
+                    self._cache.touch(cache_key, cache_ttl)
+                    for item in _extract(entry.value, key):
+                        yield item
+                    return
+
+                if not response.is_success:
+                    await response.aread()
+                    response.raise_for_status()
+
+                # Decide by the bytes actually received rather than Content-Length,
+                # which chunked and compressed responses usually omit
+                reader = _ResponseReader(response.aiter_bytes())
+                if await reader.fill(STREAM_THRESHOLD_BYTES):
+                    try:
+                        data = orjson.loads(reader.take())
+                    except orjson.JSONDecodeError as e:
+                        raise self._decode_error(response, e) from e
+                    if cache_key is not None:
+                        self._cache.set(cache_key, data, cache_ttl, response.headers.get("ETag"))
+                    for item in _extract(data, key):
+                        yield item
+                    return
+
+                prefix = "item" if await reader.peek() == b"[" else f"{key}.item"
+                try:
+                    async for item in ijson.items(reader, prefix, use_float=True):
+                        yield item
+                except ijson.JSONError as e:
+                    raise self._decode_error(response, e) from e
+        except httpx.HTTPStatusError as e:
+            raise self._status_error(e)
+        except httpx.RequestError as e:
+            logger.error(f"Request error: {e}")
+            raise APIError(status_code=0, message=f"Request failed: {e}")
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[dict[str, Any]]) -> tuple[Any, ...]:
+        """Build a cache key from an endpoint and its query parameters."""
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    @staticmethod
+    def _revalidation_headers(
+        entry: CacheEntry, headers: Optional[dict[str, str]] = None
+    ) -> dict[str, str]:
+        """Build request headers that revalidate a stale cache entry by ETag."""
+        headers = dict(headers or {})
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        return headers
+
+    @staticmethod
+    def _status_error(e: httpx.HTTPStatusError) -> APIError:
+        """Log an HTTP status error and convert it to an APIError."""
+        logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
+        return APIError(
+            status_code=e.response.status_code,
+            message=str(e),
+            details={"response": e.response.text},
+        )
+
+    @staticmethod
+    def _decode_error(response: httpx.Response, e: Exception) -> APIError:
+        """Log an undecodable response body and convert it to an APIError."""
+        logger.error(f"Invalid JSON in response from {response.url}: {e}")
+        return APIError(
+            status_code=response.status_code,
+            message=f"Invalid JSON response: {e}",
+        )
 
     async def list_organizations(self) -> list[Organization]:
         """List all organizations.
@@ -99,22 +370,20 @@ class PulsewayClient:
         Returns:
             List of organizations
         """
-        data = await self._request("GET", "/organizations")
-        
-        # Handle both dict and list responses
-        if isinstance(data, dict):
-            orgs = data.get("organizations", [])
-        else:
-            orgs = data
-            
-        return [
-            Organization(
-                id=org.get("id", ""),
-                name=org.get("name", "Unknown"),
-                description=org.get("description"),
-            )
+        data = await self._request(
+            "GET", "/organizations", cache_ttl=self._cache_ttl(ORGANIZATIONS_CACHE_TTL)
+        )
+        orgs = _extract(data, "organizations")
+
+        rows = [
+            {
+                "id": org.get("id", ""),
+                "name": org.get("name", "Unknown"),
+                "description": org.get("description"),
+            }
             for org in orgs
         ]
+        return _orgs_adapter.validate_python(rows)
 
     async def list_systems(
         self, organization_id: Optional[str] = None, online_only: bool = False
@@ -134,26 +403,27 @@ class PulsewayClient:
         if online_only:
             params["status"] = "online"
 
-        data = await self._request("GET", "/systems", params=params)
-        
-        # Handle both dict and list responses
-        if isinstance(data, dict):
-            systems = data.get("systems", [])
-        else:
-            systems = data
-
-        return [
-            SystemInfo(
-                id=system.get("id", ""),
-                name=system.get("name", "Unknown"),
-                status=SystemStatus(system.get("status", "unknown")),
-                organization_id=system.get("organization_id", ""),
-                last_seen=self._parse_datetime(system.get("last_seen")),
-                ip_address=system.get("ip_address"),
-                operating_system=system.get("operating_system"),
-            )
-            for system in systems
-        ]
+        systems = self._stream_items(
+            "/systems", "systems", cache_ttl=self._cache_ttl(SYSTEMS_CACHE_TTL), params=params
+        )
+
+        # aclosing() releases the streamed response even if building a row fails
+        async with aclosing(systems):
+            rows = [
+                {
+                    "id": system.get("id", ""),
+                    "name": system.get("name", "Unknown"),
+                    "status": _SYS_STATUS.get(
+                        system.get("status", "unknown"), SystemStatus.UNKNOWN
+                    ),
+                    "organization_id": system.get("organization_id", ""),
+                    "last_seen": self._parse_datetime(system.get("last_seen")),
+                    "ip_address": system.get("ip_address"),
+                    "operating_system": system.get("operating_system"),
+                }
+                async for system in systems
+            ]
+        return _systems_adapter.validate_python(rows)
 
     async def get_system_details(self, system_id: str) -> SystemDetails:
         """Get detailed information about a system.
@@ -164,12 +434,14 @@ class PulsewayClient:
         Returns:
             Detailed system information
         """
-        data = await self._request("GET", f"/systems/{system_id}")
+        data = await self._request(
+            "GET", f"/systems/{system_id}", cache_ttl=self._cache_ttl(SYSTEM_DETAILS_CACHE_TTL)
+        )
 
         return SystemDetails(
             id=data.get("id", system_id),
             name=data.get("name", "Unknown"),
-            status=SystemStatus(data.get("status", "unknown")),
+            status=_SYS_STATUS.get(data.get("status", "unknown"), SystemStatus.UNKNOWN),
             organization_id=data.get("organization_id", ""),
             last_seen=self._parse_datetime(data.get("last_seen")),
             ip_address=data.get("ip_address"),
@@ -182,6 +454,34 @@ class PulsewayClient:
             notifications_count=data.get("notifications_count", 0),
         )
 
+    async def get_many_system_details(
+        self, system_ids: list[str], concurrency: int = 16
+    ) -> list[SystemDetails | BaseException]:
+        """Get detailed information about several systems concurrently.
+
+        Args:
+            system_ids: System IDs
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Details for each system, in input order; failed lookups are
+            returned as the exception they raised
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(system_id: str) -> SystemDetails:
+            async with semaphore:
+                return await self.get_system_details(system_id)
+
+        return await asyncio.gather(
+            *(fetch(system_id) for system_id in system_ids), return_exceptions=True
+        )
+
     async def get_system_notifications(
         self, system_id: str, status: Optional[NotificationStatus] = None
     ) -> list[Notification]:
@@ -198,28 +498,28 @@ class PulsewayClient:
         if status:
             params["status"] = status.value
 
-        data = await self._request("GET", f"/systems/{system_id}/notifications", params=params)
-        
-        # Handle both dict and list responses
-        if isinstance(data, dict):
-            notifications = data.get("notifications", [])
-        else:
-            notifications = data
-
-        return [
-            Notification(
-                id=notif.get("id", ""),
-                system_id=system_id,
-                title=notif.get("title", ""),
-                message=notif.get("message", ""),
-                severity=notif.get("severity", "info"),
-                status=NotificationStatus(notif.get("status", "active")),
-                timestamp=self._parse_datetime(notif.get("timestamp")) or datetime.now(),
-                acknowledged_by=notif.get("acknowledged_by"),
-                acknowledged_at=self._parse_datetime(notif.get("acknowledged_at")),
-            )
-            for notif in notifications
-        ]
+        notifications = self._stream_items(
+            f"/systems/{system_id}/notifications", "notifications", params=params
+        )
+
+        async with aclosing(notifications):
+            rows = [
+                {
+                    "id": notif.get("id", ""),
+                    "system_id": system_id,
+                    "title": notif.get("title", ""),
+                    "message": notif.get("message", ""),
+                    "severity": notif.get("severity", "info"),
+                    "status": _NOTIF_STATUS.get(
+                        notif.get("status", "active"), NotificationStatus.ACTIVE
+                    ),
+                    "timestamp": self._parse_datetime(notif.get("timestamp")) or datetime.now(),
+                    "acknowledged_by": notif.get("acknowledged_by"),
+                    "acknowledged_at": self._parse_datetime(notif.get("acknowledged_at")),
+                }
+                async for notif in notifications
+            ]
+        return _notifs_adapter.validate_python(rows)
 
     async def get_system_metrics(
         self, system_id: str, metric_type: str = "cpu"
@@ -234,14 +534,45 @@ class PulsewayClient:
             System metrics
         """
         data = await self._request("GET", f"/systems/{system_id}/metrics/{metric_type}")
+        default_unit = (data.get("unit") if type(data) is dict else None) or ""
+
+        # Timestamps go through the memoized parser; points without a usable
+        # timestamp or numeric value are dropped rather than reported as zero.
+        # model_construct skips validation, so a null unit must be replaced here.
+        # Naive timestamps are taken as UTC so the period min/max can compare them
+        metrics = []
+        for point in _extract(data, "metrics"):
+            timestamp = self._parse_datetime(point.get("timestamp"))
+            if timestamp is None:
+                continue
+            timestamp = _as_utc(timestamp)
+            try:
+                value = float(point.get("value"))
+            except (TypeError, ValueError):
+                continue
+            metrics.append(
+                Metric.model_construct(
+                    timestamp=timestamp,
+                    value=value,
+                    unit=point.get("unit") or default_unit,
+                )
+            )
+
+        period_start = period_end = None
+        if type(data) is dict:
+            period_start = self._parse_datetime(data.get("period_start"))
+            period_end = self._parse_datetime(data.get("period_end"))
+        if metrics:
+            period_start = period_start or min(m.timestamp for m in metrics)
+            period_end = period_end or max(m.timestamp for m in metrics)
+        now = datetime.now()
 
-        # This is a placeholder implementation since the actual API structure may vary
         return SystemMetrics(
             system_id=system_id,
             metric_type=metric_type,  # type: ignore
-            metrics=[],
-            period_start=datetime.now(),
-            period_end=datetime.now(),
+            metrics=metrics,
+            period_start=period_start or now,
+            period_end=period_end or now,
         )
 
     @staticmethod
@@ -259,19 +590,25 @@ class PulsewayClient:
         if isinstance(value, datetime):
             return value
         try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+            return _parse_iso(value.replace("Z", "+00:00"))
         except (ValueError, AttributeError):
             logger.warning(f"Failed to parse datetime: {value}")
             return None
 
-    async def health_check(self) -> bool:
+    async def health_check(self, timeout: Optional[float] = None) -> bool:
         """Check if the API is accessible.
 
+        Args:
+            timeout: Optional timeout in seconds, overriding the client default
+
         Returns:
             True if API is accessible
         """
+        kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
         try:
-            await self._request("GET", "/health")
+            await self._request("GET", "/health", **kwargs)
             return True
         except APIError:
             return False
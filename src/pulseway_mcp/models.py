@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NotificationStatus(str, Enum):
@@ -23,6 +24,11 @@ class SystemStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Read-only value -> member tables so per-row parsing skips Enum.__call__
+_NOTIF_STATUS = MappingProxyType({m.value: m for m in NotificationStatus})
+_SYS_STATUS = MappingProxyType({m.value: m for m in SystemStatus})
+
+
 class MetricType(str, Enum):
     """Metric type enum."""
 
@@ -35,6 +41,8 @@ class MetricType(str, Enum):
 class Organization(BaseModel):
     """Pulseway organization model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: Optional[str] = None
@@ -43,6 +51,8 @@ class Organization(BaseModel):
 class SystemInfo(BaseModel):
     """Basic system information model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     status: SystemStatus
@@ -66,6 +76,8 @@ class SystemDetails(SystemInfo):
 class Notification(BaseModel):
     """System notification model."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     system_id: str
     title: str
@@ -80,6 +92,8 @@ class Notification(BaseModel):
 class Metric(BaseModel):
     """Performance metric model."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     value: float
     unit: str
@@ -98,14 +112,13 @@ class SystemMetrics(BaseModel):
 class PulsewayConfig(BaseModel):
     """Pulseway API configuration model."""
 
+    model_config = ConfigDict(frozen=True)
+
     server_url: str
     token_id: str
     token_secret: str
-
-    class Config:
-        """Pydantic config."""
-
-        frozen = True
+    http_pool_size: int = Field(100, ge=1)
+    cache_ttl: Optional[float] = Field(None, ge=0)  # overrides per-endpoint TTLs
 
 
 class APIError(Exception):
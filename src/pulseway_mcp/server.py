@@ -3,15 +3,17 @@
 import asyncio
 import logging
 import os
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import orjson
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, TextContent, Tool
 
 from .client import PulsewayClient
-from .models import NotificationStatus, PulsewayConfig
+from .models import NotificationStatus, PulsewayConfig, SystemDetails
 
 # Load environment variables
 load_dotenv()
@@ -29,16 +31,26 @@ app = Server("pulseway-mcp-server")
 # Global client instance
 _pulseway_client: PulsewayClient | None = None
 
+# Startup warm-up must not hold up the MCP handshake for the full request timeout
+STARTUP_HEALTH_CHECK_TIMEOUT = 5.0
+
+# Upper bound on systems per bulk call; each one costs a request against the
+# API's hourly rate limit
+MAX_BULK_SYSTEMS = 50
+
 
 def get_client() -> PulsewayClient:
     """Get or create the Pulseway client."""
     global _pulseway_client
     
     if _pulseway_client is None:
+        cache_ttl = os.getenv("PULSEWAY_CACHE_TTL")
         config = PulsewayConfig(
             server_url=os.getenv("PULSEWAY_SERVER_URL", ""),
             token_id=os.getenv("PULSEWAY_TOKEN_ID", ""),
             token_secret=os.getenv("PULSEWAY_TOKEN_SECRET", ""),
+            http_pool_size=int(os.getenv("PULSEWAY_HTTP_POOL_SIZE", "100")),
+            cache_ttl=float(cache_ttl) if cache_ttl else None,
         )
         
         if not all([config.server_url, config.token_id, config.token_secret]):
@@ -52,6 +64,145 @@ def get_client() -> PulsewayClient:
     return _pulseway_client
 
 
+# Static MCP descriptors, built once instead of on every discovery request
+_RESOURCES: list[Resource] = [
+    Resource(
+        uri="pulseway://docs/api",
+        name="Pulseway API Documentation",
+        mimeType="text/plain",
+        description="Documentation for the Pulseway RMM API",
+    ),
+    Resource(
+        uri="pulseway://systems",
+        name="Managed Systems",
+        mimeType="application/json",
+        description="List of all managed systems",
+    ),
+]
+
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_systems",
+        description="List all systems managed by Pulseway",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "organization_id": {
+                    "type": "string",
+                    "description": "Optional organization ID to filter by",
+                },
+                "online_only": {
+                    "type": "boolean",
+                    "description": "If true, only return online systems",
+                    "default": False,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="get_system_details",
+        description="Get detailed information about a specific system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "system_id": {
+                    "type": "string",
+                    "description": "The ID of the system",
+                },
+            },
+            "required": ["system_id"],
+        },
+    ),
+    Tool(
+        name="get_systems_details_bulk",
+        description="Get detailed information about several systems at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "system_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "maxItems": MAX_BULK_SYSTEMS,
+                    "description": "The IDs of the systems",
+                },
+            },
+            "required": ["system_ids"],
+        },
+    ),
+    Tool(
+        name="get_system_notifications",
+        description="Get notifications for a specific system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "system_id": {
+                    "type": "string",
+                    "description": "The ID of the system",
+                },
+                "status": {
+                    "type": "string",
+                    "enum": ["active", "acknowledged", "resolved"],
+                    "description": "Filter by notification status",
+                },
+            },
+            "required": ["system_id"],
+        },
+    ),
+    Tool(
+        name="list_organizations",
+        description="List all organizations in the Pulseway account",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_system_metrics",
+        description="Get performance metrics for a system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "system_id": {
+                    "type": "string",
+                    "description": "The ID of the system",
+                },
+                "metric_type": {
+                    "type": "string",
+                    "enum": ["cpu", "memory", "disk", "network"],
+                    "description": "Type of metric to retrieve",
+                    "default": "cpu",
+                },
+            },
+            "required": ["system_id"],
+        },
+    ),
+]
+
+
+def _json_result(result: Any) -> list[TextContent]:
+    """Serialize a tool result as JSON text content."""
+    text = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+    return [TextContent(type="text", text=text)]
+
+
+def _system_details_dict(details: SystemDetails) -> dict[str, Any]:
+    """Convert system details to a JSON-serializable dict."""
+    return {
+        "id": details.id,
+        "name": details.name,
+        "status": details.status.value,
+        "organization_id": details.organization_id,
+        "last_seen": details.last_seen,
+        "ip_address": details.ip_address,
+        "operating_system": details.operating_system,
+        "cpu_usage": details.cpu_usage,
+        "memory_usage": details.memory_usage,
+        "disk_usage": details.disk_usage,
+        "uptime": details.uptime,
+        "notifications_count": details.notifications_count,
+    }
+
+
 @app.list_resources()
 async def list_resources() -> list[Resource]:
     """List available MCP resources.
@@ -59,20 +210,7 @@ async def list_resources() -> list[Resource]:
     Returns:
         List of available resources
     """
-    return [
-        Resource(
-            uri="pulseway://docs/api",
-            name="Pulseway API Documentation",
-            mimeType="text/plain",
-            description="Documentation for the Pulseway RMM API",
-        ),
-        Resource(
-            uri="pulseway://systems",
-            name="Managed Systems",
-            mimeType="application/json",
-            description="List of all managed systems",
-        ),
-    ]
+    return _RESOURCES
 
 
 @app.read_resource()
@@ -111,9 +249,8 @@ For full documentation, visit: https://api.pulseway.com/
     
     elif uri == "pulseway://systems":
         client = get_client()
-        async with client:
-            systems = await client.list_systems()
-            return "\n".join([f"- {s.name} ({s.id}): {s.status}" for s in systems])
+        systems = await client.list_systems()
+        return "\n".join([f"- {s.name} ({s.id}): {s.status}" for s in systems])
     
     raise ValueError(f"Unknown resource: {uri}")
 
@@ -125,87 +262,140 @@ async def list_tools() -> list[Tool]:
     Returns:
         List of available tools
     """
-    return [
-        Tool(
-            name="list_systems",
-            description="List all systems managed by Pulseway",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "organization_id": {
-                        "type": "string",
-                        "description": "Optional organization ID to filter by",
-                    },
-                    "online_only": {
-                        "type": "boolean",
-                        "description": "If true, only return online systems",
-                        "default": False,
-                    },
-                },
-            },
-        ),
-        Tool(
-            name="get_system_details",
-            description="Get detailed information about a specific system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "system_id": {
-                        "type": "string",
-                        "description": "The ID of the system",
-                    },
-                },
-                "required": ["system_id"],
-            },
-        ),
-        Tool(
-            name="get_system_notifications",
-            description="Get notifications for a specific system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "system_id": {
-                        "type": "string",
-                        "description": "The ID of the system",
-                    },
-                    "status": {
-                        "type": "string",
-                        "enum": ["active", "acknowledged", "resolved"],
-                        "description": "Filter by notification status",
-                    },
-                },
-                "required": ["system_id"],
-            },
-        ),
-        Tool(
-            name="list_organizations",
-            description="List all organizations in the Pulseway account",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
-        ),
-        Tool(
-            name="get_system_metrics",
-            description="Get performance metrics for a system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "system_id": {
-                        "type": "string",
-                        "description": "The ID of the system",
-                    },
-                    "metric_type": {
-                        "type": "string",
-                        "enum": ["cpu", "memory", "disk", "network"],
-                        "description": "Type of metric to retrieve",
-                        "default": "cpu",
-                    },
-                },
-                "required": ["system_id"],
-            },
-        ),
-    ]
+    return _TOOLS
+
+
+async def _list_systems(client: PulsewayClient, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle the list_systems tool."""
+    systems = await client.list_systems(
+        organization_id=arguments.get("organization_id"),
+        online_only=arguments.get("online_only", False),
+    )
+    result = {
+        "systems": [
+            {
+                "id": s.id,
+                "name": s.name,
+                "status": s.status.value,
+                "organization_id": s.organization_id,
+                "last_seen": s.last_seen,
+                "ip_address": s.ip_address,
+                "operating_system": s.operating_system,
+            }
+            for s in systems
+        ],
+        "count": len(systems),
+    }
+    return _json_result(result)
+
+
+async def _get_system_details(
+    client: PulsewayClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle the get_system_details tool."""
+    details = await client.get_system_details(arguments["system_id"])
+    return _json_result(_system_details_dict(details))
+
+
+async def _get_systems_details_bulk(
+    client: PulsewayClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle the get_systems_details_bulk tool."""
+    system_ids = list(dict.fromkeys(arguments["system_ids"]))
+    if len(system_ids) > MAX_BULK_SYSTEMS:
+        raise ValueError(f"Too many system IDs: {len(system_ids)} (maximum is {MAX_BULK_SYSTEMS})")
+    bulk = await client.get_many_system_details(system_ids)
+    found: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    for system_id, item in zip(system_ids, bulk, strict=True):
+        if isinstance(item, BaseException):
+            errors.append({"system_id": system_id, "error": str(item)})
+        else:
+            found.append(_system_details_dict(item))
+    result = {"systems": found, "errors": errors, "count": len(found)}
+    return _json_result(result)
+
+
+async def _get_system_notifications(
+    client: PulsewayClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle the get_system_notifications tool."""
+    status = arguments.get("status")
+    status_enum = NotificationStatus(status) if status else None
+
+    notifications = await client.get_system_notifications(arguments["system_id"], status_enum)
+    result = {
+        "notifications": [
+            {
+                "id": n.id,
+                "title": n.title,
+                "message": n.message,
+                "severity": n.severity,
+                "status": n.status.value,
+                "timestamp": n.timestamp,
+                "acknowledged_by": n.acknowledged_by,
+                "acknowledged_at": n.acknowledged_at,
+            }
+            for n in notifications
+        ],
+        "count": len(notifications),
+    }
+    return _json_result(result)
+
+
+async def _list_organizations(
+    client: PulsewayClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle the list_organizations tool."""
+    organizations = await client.list_organizations()
+    result = {
+        "organizations": [
+            {
+                "id": o.id,
+                "name": o.name,
+                "description": o.description,
+            }
+            for o in organizations
+        ],
+        "count": len(organizations),
+    }
+    return _json_result(result)
+
+
+async def _get_system_metrics(
+    client: PulsewayClient, arguments: dict[str, Any]
+) -> list[TextContent]:
+    """Handle the get_system_metrics tool."""
+    metrics = await client.get_system_metrics(
+        arguments["system_id"], arguments.get("metric_type", "cpu")
+    )
+    result = {
+        "system_id": metrics.system_id,
+        "metric_type": metrics.metric_type.value,
+        "period_start": metrics.period_start,
+        "period_end": metrics.period_end,
+        "metrics": [
+            {
+                "timestamp": m.timestamp,
+                "value": m.value,
+                "unit": m.unit,
+            }
+            for m in metrics.metrics
+        ],
+    }
+    return _json_result(result)
+
+
+_ToolHandler = Callable[[PulsewayClient, dict[str, Any]], Awaitable[list[TextContent]]]
+
+_TOOL_HANDLERS: dict[str, _ToolHandler] = {
+    "list_systems": _list_systems,
+    "get_system_details": _get_system_details,
+    "get_systems_details_bulk": _get_systems_details_bulk,
+    "get_system_notifications": _get_system_notifications,
+    "list_organizations": _list_organizations,
+    "get_system_metrics": _get_system_metrics,
+}
 
 
 @app.call_tool()
@@ -222,113 +412,11 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     client = get_client()
     
     try:
-        async with client:
-            if name == "list_systems":
-                systems = await client.list_systems(
-                    organization_id=arguments.get("organization_id"),
-                    online_only=arguments.get("online_only", False),
-                )
-                result = {
-                    "systems": [
-                        {
-                            "id": s.id,
-                            "name": s.name,
-                            "status": s.status.value,
-                            "organization_id": s.organization_id,
-                            "last_seen": s.last_seen.isoformat() if s.last_seen else None,
-                            "ip_address": s.ip_address,
-                            "operating_system": s.operating_system,
-                        }
-                        for s in systems
-                    ],
-                    "count": len(systems),
-                }
-                return [TextContent(type="text", text=str(result))]
-            
-            elif name == "get_system_details":
-                system_id = arguments["system_id"]
-                details = await client.get_system_details(system_id)
-                result = {
-                    "id": details.id,
-                    "name": details.name,
-                    "status": details.status.value,
-                    "organization_id": details.organization_id,
-                    "last_seen": details.last_seen.isoformat() if details.last_seen else None,
-                    "ip_address": details.ip_address,
-                    "operating_system": details.operating_system,
-                    "cpu_usage": details.cpu_usage,
-                    "memory_usage": details.memory_usage,
-                    "disk_usage": details.disk_usage,
-                    "uptime": details.uptime,
-                    "notifications_count": details.notifications_count,
-                }
-                return [TextContent(type="text", text=str(result))]
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await handler(client, arguments)
             
-            elif name == "get_system_notifications":
-                system_id = arguments["system_id"]
-                status = arguments.get("status")
-                status_enum = NotificationStatus(status) if status else None
-                
-                notifications = await client.get_system_notifications(system_id, status_enum)
-                result = {
-                    "notifications": [
-                        {
-                            "id": n.id,
-                            "title": n.title,
-                            "message": n.message,
-                            "severity": n.severity,
-                            "status": n.status.value,
-                            "timestamp": n.timestamp.isoformat(),
-                            "acknowledged_by": n.acknowledged_by,
-                            "acknowledged_at": (
-                                n.acknowledged_at.isoformat() if n.acknowledged_at else None
-                            ),
-                        }
-                        for n in notifications
-                    ],
-                    "count": len(notifications),
-                }
-                return [TextContent(type="text", text=str(result))]
-            
-            elif name == "list_organizations":
-                organizations = await client.list_organizations()
-                result = {
-                    "organizations": [
-                        {
-                            "id": o.id,
-                            "name": o.name,
-                            "description": o.description,
-                        }
-                        for o in organizations
-                    ],
-                    "count": len(organizations),
-                }
-                return [TextContent(type="text", text=str(result))]
-            
-            elif name == "get_system_metrics":
-                system_id = arguments["system_id"]
-                metric_type = arguments.get("metric_type", "cpu")
-                
-                metrics = await client.get_system_metrics(system_id, metric_type)
-                result = {
-                    "system_id": metrics.system_id,
-                    "metric_type": metrics.metric_type.value,
-                    "period_start": metrics.period_start.isoformat(),
-                    "period_end": metrics.period_end.isoformat(),
-                    "metrics": [
-                        {
-                            "timestamp": m.timestamp.isoformat(),
-                            "value": m.value,
-                            "unit": m.unit,
-                        }
-                        for m in metrics.metrics
-                    ],
-                }
-                return [TextContent(type="text", text=str(result))]
-            
-            else:
-                raise ValueError(f"Unknown tool: {name}")
-                
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -340,15 +428,29 @@ async def main() -> None:
     
     # Verify configuration
     try:
-        get_client()
+        client = get_client()
         logger.info("Configuration validated successfully")
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise
     
-    # Run the server
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    # Run the server, reusing one client (and its connection pool) for all calls
+    try:
+        # Pre-warm DNS/TLS so the first tool call does not pay for the handshake
+        try:
+            healthy = await client.health_check(timeout=STARTUP_HEALTH_CHECK_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Pulseway API health check raised {e!r}")
+            healthy = False
+        if healthy:
+            logger.info("Pulseway API connection established")
+        else:
+            logger.warning("Pulseway API health check failed; continuing startup")
+
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await client.aclose()
 
 
 def run() -> None:
@@ -0,0 +1,37 @@
+"""Shared fixtures for the Pulseway MCP Server tests."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from pulseway_mcp.client import PulsewayClient
+from pulseway_mcp.models import PulsewayConfig
+
+
+@pytest.fixture(scope="session")
+def config() -> PulsewayConfig:
+    """Create a test configuration."""
+    return PulsewayConfig(
+        server_url="https://test.pulseway.com",
+        token_id="test_token_id",
+        token_secret="test_token_secret",
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _session_client(config: PulsewayConfig) -> AsyncIterator[PulsewayClient]:
+    """Create one Pulseway client (and HTTP connection pool) for the whole session."""
+    async with PulsewayClient(config) as client:
+        yield client
+
+
+@pytest.fixture
+def client(_session_client: PulsewayClient) -> PulsewayClient:
+    """Provide the shared client with an empty response cache.
+
+    pytest-httpx resets its mocked routes per test; clearing the cache keeps
+    responses from one test from being served to the next.
+    """
+    _session_client.clear_cache()
+    return _session_client
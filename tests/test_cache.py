@@ -0,0 +1,110 @@
+"""Tests for the response cache."""
+
+import pytest
+
+from pulseway_mcp.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TTLCache:
+    """Create a cache driven by the fake clock."""
+    return TTLCache(clock=clock)
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_before_and_after_expiry(self, cache: TTLCache, clock: FakeClock) -> None:
+        """Test that values are served until their TTL elapses."""
+        cache.set("key", "value", ttl=10)
+
+        assert cache.get("key") == "value"
+        clock.now += 10
+        assert cache.get("key") is None
+        assert cache.get("key", "default") == "default"
+
+    def test_expired_entry_without_etag_is_evicted(self, cache: TTLCache, clock: FakeClock) -> None:
+        """Test that expired entries without an ETag are dropped on lookup."""
+        cache.set("key", "value", ttl=10)
+        clock.now += 11
+
+        assert cache.get_entry("key") is None
+        assert len(cache) == 0
+
+    def test_expired_entry_with_etag_is_kept(self, cache: TTLCache, clock: FakeClock) -> None:
+        """Test that expired entries with an ETag stay available for revalidation."""
+        cache.set("key", "value", ttl=10, etag='"v1"')
+        clock.now += 11
+
+        entry = cache.get_entry("key")
+        assert entry is not None
+        assert entry.etag == '"v1"'
+        assert not cache.is_fresh(entry)
+        assert cache.get("key") is None
+
+    def test_expired_entry_with_etag_is_dropped_after_max_stale(self, clock: FakeClock) -> None:
+        """Test that revalidatable entries are not kept forever."""
+        cache = TTLCache(clock=clock, max_stale=60)
+        cache.set("key", "value", ttl=10, etag='"v1"')
+        clock.now += 10 + 61
+
+        assert cache.get_entry("key") is None
+        assert len(cache) == 0
+
+    def test_max_entries_evicts_stale_then_oldest(self, clock: FakeClock) -> None:
+        """Test that the size cap drops unusable entries before live ones."""
+        cache = TTLCache(clock=clock, max_entries=2)
+        cache.set("expired", 0, ttl=1)
+        cache.set("old", 1, ttl=100)
+        clock.now += 2
+        cache.set("new", 2, ttl=100)
+
+        assert len(cache) == 2
+        assert cache.get_entry("expired") is None
+
+        cache.set("newest", 3, ttl=100)
+
+        assert len(cache) == 2
+        assert cache.get("old") is None
+        assert cache.get("new") == 2
+        assert cache.get("newest") == 3
+
+    def test_touch_extends_lifetime(self, cache: TTLCache, clock: FakeClock) -> None:
+        """Test that touch makes an expired entry fresh again."""
+        cache.set("key", "value", ttl=10, etag='"v1"')
+        clock.now += 11
+        cache.touch("key", ttl=10)
+
+        assert cache.get("key") == "value"
+        clock.now += 10
+        assert cache.get("key") is None
+
+    def test_touch_missing_key(self, cache: TTLCache) -> None:
+        """Test that touching an unknown key does nothing."""
+        cache.touch("missing", ttl=10)
+
+        assert len(cache) == 0
+
+    def test_clear(self, cache: TTLCache) -> None:
+        """Test that clear drops every entry."""
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=10, etag='"v1"')
+        cache.clear()
+
+        assert len(cache) == 0
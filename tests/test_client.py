@@ -1,57 +1,34 @@
 """Tests for the Pulseway API client."""
 
+import json
+import re
+import time
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+import orjson
 import pytest
 from datetime import datetime
-from pytest_httpx import HTTPXMock
+from pydantic import ValidationError
+from pytest_httpx import HTTPXMock, IteratorStream
 
-from pulseway_mcp.client import PulsewayClient
+from pulseway_mcp.client import STREAM_THRESHOLD_BYTES, PulsewayClient
 from pulseway_mcp.models import (
     APIError,
+    MetricType,
     NotificationStatus,
     PulsewayConfig,
+    SystemDetails,
     SystemStatus,
 )
 
 
-@pytest.fixture
-def config() -> PulsewayConfig:
-    """Create a test configuration."""
-    return PulsewayConfig(
-        server_url="https://test.pulseway.com",
-        token_id="test_token_id",
-        token_secret="test_token_secret",
-    )
-
-
-@pytest.fixture
-def mock_systems_response() -> list[dict]:
-    """Mock systems API response."""
-    return [
-        {
-            "id": "sys1",
-            "name": "Server 1",
-            "status": "online",
-            "organization_id": "org1",
-            "last_seen": "2025-01-01T12:00:00Z",
-            "ip_address": "192.168.1.100",
-            "operating_system": "Windows Server 2022",
-        },
-        {
-            "id": "sys2",
-            "name": "Server 2",
-            "status": "offline",
-            "organization_id": "org1",
-            "last_seen": "2025-01-01T10:00:00Z",
-            "ip_address": "192.168.1.101",
-            "operating_system": "Ubuntu 22.04",
-        },
-    ]
+_JSON_HEADERS = {"content-type": "application/json"}
 
 
-@pytest.fixture
-def mock_system_details_response() -> dict:
-    """Mock system details API response."""
-    return {
+# Mock API payloads, plus their JSON bodies encoded once at import time
+_SYSTEMS_RESPONSE: list[dict] = [
+    {
         "id": "sys1",
         "name": "Server 1",
         "status": "online",
@@ -59,70 +36,119 @@ def mock_system_details_response() -> dict:
         "last_seen": "2025-01-01T12:00:00Z",
         "ip_address": "192.168.1.100",
         "operating_system": "Windows Server 2022",
-        "cpu_usage": 45.5,
-        "memory_usage": 62.3,
-        "disk_usage": 78.1,
-        "uptime": 86400,
-        "notifications_count": 3,
-    }
+    },
+    {
+        "id": "sys2",
+        "name": "Server 2",
+        "status": "offline",
+        "organization_id": "org1",
+        "last_seen": "2025-01-01T10:00:00Z",
+        "ip_address": "192.168.1.101",
+        "operating_system": "Ubuntu 22.04",
+    },
+]
+
+_SYSTEM_DETAILS_RESPONSE: dict = {
+    "id": "sys1",
+    "name": "Server 1",
+    "status": "online",
+    "organization_id": "org1",
+    "last_seen": "2025-01-01T12:00:00Z",
+    "ip_address": "192.168.1.100",
+    "operating_system": "Windows Server 2022",
+    "cpu_usage": 45.5,
+    "memory_usage": 62.3,
+    "disk_usage": 78.1,
+    "uptime": 86400,
+    "notifications_count": 3,
+}
+
+_NOTIFS_RESPONSE: list[dict] = [
+    {
+        "id": "notif1",
+        "title": "High CPU Usage",
+        "message": "CPU usage exceeded 80%",
+        "severity": "warning",
+        "status": "active",
+        "timestamp": "2025-01-01T12:00:00Z",
+    },
+    {
+        "id": "notif2",
+        "title": "Disk Space Low",
+        "message": "Disk space below 20%",
+        "severity": "error",
+        "status": "acknowledged",
+        "timestamp": "2025-01-01T11:00:00Z",
+        "acknowledged_by": "admin@example.com",
+        "acknowledged_at": "2025-01-01T11:30:00Z",
+    },
+]
+
+_ORGS_RESPONSE: list[dict] = [
+    {
+        "id": "org1",
+        "name": "Organization 1",
+        "description": "Test organization",
+    },
+    {
+        "id": "org2",
+        "name": "Organization 2",
+    },
+]
+
+_SYSTEMS_BODY = orjson.dumps({"systems": _SYSTEMS_RESPONSE})
+_SYSTEM_DETAILS_BODY = orjson.dumps(_SYSTEM_DETAILS_RESPONSE)
+_NOTIFS_BODY = orjson.dumps({"notifications": _NOTIFS_RESPONSE})
+_ORGS_BODY = orjson.dumps({"organizations": _ORGS_RESPONSE})
+
+
+@pytest.fixture(scope="module")
+def mock_systems_response() -> list[dict]:
+    """Mock systems API response."""
+    return _SYSTEMS_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_notifications_response() -> list[dict]:
     """Mock notifications API response."""
-    return [
-        {
-            "id": "notif1",
-            "title": "High CPU Usage",
-            "message": "CPU usage exceeded 80%",
-            "severity": "warning",
-            "status": "active",
-            "timestamp": "2025-01-01T12:00:00Z",
-        },
-        {
-            "id": "notif2",
-            "title": "Disk Space Low",
-            "message": "Disk space below 20%",
-            "severity": "error",
-            "status": "acknowledged",
-            "timestamp": "2025-01-01T11:00:00Z",
-            "acknowledged_by": "admin@example.com",
-            "acknowledged_at": "2025-01-01T11:30:00Z",
-        },
-    ]
+    return _NOTIFS_RESPONSE
+
+
+_API_URL = re.compile(r"https://test\.pulseway\.com/api/v1/.*")
 
 
 @pytest.fixture
-def mock_organizations_response() -> list[dict]:
-    """Mock organizations API response."""
-    return [
-        {
-            "id": "org1",
-            "name": "Organization 1",
-            "description": "Test organization",
-        },
-        {
-            "id": "org2",
-            "name": "Organization 2",
-        },
-    ]
+def routes(httpx_mock: HTTPXMock) -> Iterator[dict[str, bytes]]:
+    """Serve JSON bodies by request path through a single mocked route.
+
+    Tests map API paths to response bodies instead of registering one
+    response per URL; paths left out of the table answer with a 404.
+    Like pytest-httpx's own check, every registered path must be requested.
+    """
+    table: dict[str, bytes] = {}
+    served: set[str] = set()
+
+    def dispatch(request: httpx.Request) -> httpx.Response:
+        body = table.get(request.url.path)
+        if body is None:
+            return httpx.Response(404)
+        served.add(request.url.path)
+        return httpx.Response(200, content=body, headers=_JSON_HEADERS)
+
+    httpx_mock.add_callback(dispatch, url=_API_URL, is_reusable=True)
+    yield table
+    assert not table.keys() - served, f"Unrequested routes: {sorted(table.keys() - served)}"
 
 
 class TestPulsewayClient:
     """Test cases for PulsewayClient."""
 
     @pytest.mark.asyncio
-    async def test_list_systems(
-        self, config: PulsewayConfig, httpx_mock: HTTPXMock, mock_systems_response: list[dict]
-    ) -> None:
+    async def test_list_systems(self, client: PulsewayClient, routes: dict[str, bytes]) -> None:
         """Test listing systems."""
-        httpx_mock.add_response(
-            url="https://test.pulseway.com/api/v1/systems",
-            json={"systems": mock_systems_response},
-        )
+        routes["/api/v1/systems"] = _SYSTEMS_BODY
 
-        async with PulsewayClient(config) as client:
-            systems = await client.list_systems()
+        systems = await client.list_systems()
 
         assert len(systems) == 2
         assert systems[0].id == "sys1"
@@ -132,35 +158,28 @@ class TestPulsewayClient:
 
     @pytest.mark.asyncio
     async def test_list_systems_with_filters(
-        self, config: PulsewayConfig, httpx_mock: HTTPXMock, mock_systems_response: list[dict]
+        self, client: PulsewayClient, httpx_mock: HTTPXMock, mock_systems_response: list[dict]
     ) -> None:
         """Test listing systems with filters."""
         httpx_mock.add_response(
-            url="https://test.pulseway.com/api/v1/systems?organization_id=org1&status=online",
+            url="https://test.pulseway.com/api/v1/systems",
+            match_params={"organization_id": "org1", "status": "online"},
             json={"systems": [mock_systems_response[0]]},
         )
 
-        async with PulsewayClient(config) as client:
-            systems = await client.list_systems(organization_id="org1", online_only=True)
+        systems = await client.list_systems(organization_id="org1", online_only=True)
 
         assert len(systems) == 1
         assert systems[0].status == SystemStatus.ONLINE
 
     @pytest.mark.asyncio
     async def test_get_system_details(
-        self,
-        config: PulsewayConfig,
-        httpx_mock: HTTPXMock,
-        mock_system_details_response: dict,
+        self, client: PulsewayClient, routes: dict[str, bytes]
     ) -> None:
         """Test getting system details."""
-        httpx_mock.add_response(
-            url="https://test.pulseway.com/api/v1/systems/sys1",
-            json=mock_system_details_response,
-        )
+        routes["/api/v1/systems/sys1"] = _SYSTEM_DETAILS_BODY
 
-        async with PulsewayClient(config) as client:
-            details = await client.get_system_details("sys1")
+        details = await client.get_system_details("sys1")
 
         assert details.id == "sys1"
         assert details.name == "Server 1"
@@ -172,19 +191,12 @@ class TestPulsewayClient:
 
     @pytest.mark.asyncio
     async def test_get_system_notifications(
-        self,
-        config: PulsewayConfig,
-        httpx_mock: HTTPXMock,
-        mock_notifications_response: list[dict],
+        self, client: PulsewayClient, routes: dict[str, bytes]
     ) -> None:
         """Test getting system notifications."""
-        httpx_mock.add_response(
-            url="https://test.pulseway.com/api/v1/systems/sys1/notifications",
-            json={"notifications": mock_notifications_response},
-        )
+        routes["/api/v1/systems/sys1/notifications"] = _NOTIFS_BODY
 
-        async with PulsewayClient(config) as client:
-            notifications = await client.get_system_notifications("sys1")
+        notifications = await client.get_system_notifications("sys1")
 
         assert len(notifications) == 2
         assert notifications[0].id == "notif1"
@@ -195,39 +207,32 @@ class TestPulsewayClient:
     @pytest.mark.asyncio
     async def test_get_system_notifications_with_filter(
         self,
-        config: PulsewayConfig,
+        client: PulsewayClient,
         httpx_mock: HTTPXMock,
         mock_notifications_response: list[dict],
     ) -> None:
         """Test getting system notifications with status filter."""
         httpx_mock.add_response(
-            url="https://test.pulseway.com/api/v1/systems/sys1/notifications?status=active",
+            url="https://test.pulseway.com/api/v1/systems/sys1/notifications",
+            match_params={"status": "active"},
             json={"notifications": [mock_notifications_response[0]]},
         )
 
-        async with PulsewayClient(config) as client:
-            notifications = await client.get_system_notifications(
-                "sys1", NotificationStatus.ACTIVE
-            )
+        notifications = await client.get_system_notifications(
+            "sys1", NotificationStatus.ACTIVE
+        )
 
         assert len(notifications) == 1
         assert notifications[0].status == NotificationStatus.ACTIVE
 
     @pytest.mark.asyncio
     async def test_list_organizations(
-        self,
-        config: PulsewayConfig,
-        httpx_mock: HTTPXMock,
-        mock_organizations_response: list[dict],
+        self, client: PulsewayClient, routes: dict[str, bytes]
     ) -> None:
         """Test listing organizations."""
-        httpx_mock.add_response(
-            url="https://test.pulseway.com/api/v1/organizations",
-            json={"organizations": mock_organizations_response},
-        )
+        routes["/api/v1/organizations"] = _ORGS_BODY
 
-        async with PulsewayClient(config) as client:
-            organizations = await client.list_organizations()
+        organizations = await client.list_organizations()
 
         assert len(organizations) == 2
         assert organizations[0].id == "org1"
@@ -237,7 +242,7 @@ class TestPulsewayClient:
 
     @pytest.mark.asyncio
     async def test_api_error_handling(
-        self, config: PulsewayConfig, httpx_mock: HTTPXMock
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
     ) -> None:
         """Test API error handling."""
         httpx_mock.add_response(
@@ -246,28 +251,65 @@ class TestPulsewayClient:
             json={"error": "Unauthorized"},
         )
 
-        async with PulsewayClient(config) as client:
-            with pytest.raises(APIError) as exc_info:
-                await client.list_systems()
+        with pytest.raises(APIError) as exc_info:
+            await client.list_systems()
 
         assert exc_info.value.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_health_check(self, config: PulsewayConfig, httpx_mock: HTTPXMock) -> None:
+    async def test_list_systems_redirect_is_error(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a redirected list request raises APIError, like _request does."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            status_code=302,
+            headers={"Location": "https://test.pulseway.com/login"},
+            text="<html>Sign in</html>",
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            await client.list_systems()
+
+        assert exc_info.value.status_code == 302
+
+    @pytest.mark.asyncio
+    async def test_get_system_metrics_mixed_offsets(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that naive and offset-aware timestamps can be mixed in one payload."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems/sys1/metrics/cpu",
+            json={
+                "unit": "%",
+                "metrics": [
+                    {"timestamp": "2025-01-01T12:05:00Z", "value": 10},
+                    {"timestamp": "2025-01-01T12:00:00", "value": 20},
+                ],
+            },
+        )
+
+        metrics = await client.get_system_metrics("sys1", "cpu")
+
+        assert [m.value for m in metrics.metrics] == [10.0, 20.0]
+        assert metrics.period_start == datetime.fromisoformat("2025-01-01T12:00:00+00:00")
+        assert metrics.period_end == datetime.fromisoformat("2025-01-01T12:05:00+00:00")
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, client: PulsewayClient, httpx_mock: HTTPXMock) -> None:
         """Test health check."""
         httpx_mock.add_response(
             url="https://test.pulseway.com/api/v1/health",
             json={"status": "ok"},
         )
 
-        async with PulsewayClient(config) as client:
-            result = await client.health_check()
+        result = await client.health_check()
 
         assert result is True
 
     @pytest.mark.asyncio
     async def test_health_check_failure(
-        self, config: PulsewayConfig, httpx_mock: HTTPXMock
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
     ) -> None:
         """Test health check failure."""
         httpx_mock.add_response(
@@ -275,7 +317,319 @@ class TestPulsewayClient:
             status_code=503,
         )
 
-        async with PulsewayClient(config) as client:
-            result = await client.health_check()
+        result = await client.health_check()
 
         assert result is False
+
+    @pytest.mark.asyncio
+    async def test_health_check_non_json(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a non-JSON health response fails the check instead of raising."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/health",
+            text="OK",
+        )
+
+        assert await client.health_check(timeout=5.0) is False
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_raises_api_error(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that undecodable bodies are reported as APIError."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/organizations",
+            text="<html>Maintenance</html>",
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            await client.list_organizations()
+
+        assert exc_info.value.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_contexts(
+        self, config: PulsewayConfig, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that an already-open client survives ``async with`` blocks."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/health",
+            json={"status": "ok"},
+        )
+
+        client = PulsewayClient(config)
+        http_client = client.client
+
+        async with client:
+            assert await client.health_check() is True
+
+        assert client.client is http_client
+        assert not http_client.is_closed
+
+        await client.aclose()
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_nested_contexts_close_on_outer_exit(self, config: PulsewayConfig) -> None:
+        """Test that only the outermost context that opened the pool closes it."""
+        client = PulsewayClient(config)
+
+        async with client:
+            http_client = client.client
+            async with client:
+                pass
+            assert not http_client.is_closed
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_list_systems_cached(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock, routes: dict[str, bytes]
+    ) -> None:
+        """Test that repeated list_systems calls are served from the cache."""
+        routes["/api/v1/systems"] = _SYSTEMS_BODY
+
+        first = await client.list_systems()
+        second = await client.list_systems()
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert [s.id for s in first] == [s.id for s in second]
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a cache TTL of zero disables response caching."""
+        config = PulsewayConfig(
+            server_url="https://test.pulseway.com",
+            token_id="test_token_id",
+            token_secret="test_token_secret",
+            cache_ttl=0,
+        )
+        for _ in range(2):
+            httpx_mock.add_response(
+                url="https://test.pulseway.com/api/v1/organizations",
+                content=_ORGS_BODY,
+                headers=_JSON_HEADERS,
+            )
+
+        async with PulsewayClient(config) as client:
+            await client.list_organizations()
+            await client.list_organizations()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_systems_unknown_status(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that unrecognised system statuses map to UNKNOWN."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            json=[{"id": "sys3", "name": "Server 3", "status": "rebooting"}],
+        )
+
+        systems = await client.list_systems()
+
+        assert systems[0].status == SystemStatus.UNKNOWN
+
+    def test_parse_datetime(self) -> None:
+        """Test datetime parsing of API timestamps."""
+        parsed = PulsewayClient._parse_datetime("2025-01-01T12:00:00Z")
+
+        assert parsed == datetime.fromisoformat("2025-01-01T12:00:00+00:00")
+        assert PulsewayClient._parse_datetime("2025-01-01T12:00:00Z") is parsed
+        assert PulsewayClient._parse_datetime("not a date") is None
+        assert PulsewayClient._parse_datetime(None) is None
+
+    @pytest.mark.asyncio
+    async def test_list_systems_streamed(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock, mock_systems_response: list[dict]
+    ) -> None:
+        """Test that bodies larger than the stream threshold are parsed incrementally."""
+        body = json.dumps({"systems": mock_systems_response * 500}).encode()
+        assert len(body) > STREAM_THRESHOLD_BYTES
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            stream=IteratorStream([body[i : i + 1000] for i in range(0, len(body), 1000)]),
+        )
+
+        systems = await client.list_systems()
+
+        assert len(systems) == 1000
+        assert systems[0].id == "sys1"
+        assert systems[-1].status == SystemStatus.OFFLINE
+
+    @pytest.mark.asyncio
+    async def test_list_systems_stream_closed_on_bad_row(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock, mock_systems_response: list[dict]
+    ) -> None:
+        """Test that the streamed response is closed when building a row fails."""
+        body = json.dumps(["not an object"] + mock_systems_response * 500).encode()
+
+        class TrackedStream(httpx.AsyncByteStream):
+            closed = False
+
+            async def __aiter__(self) -> AsyncIterator[bytes]:
+                for i in range(0, len(body), 1000):
+                    yield body[i : i + 1000]
+
+            async def aclose(self) -> None:
+                self.closed = True
+
+        stream = TrackedStream()
+        httpx_mock.add_response(url="https://test.pulseway.com/api/v1/systems", stream=stream)
+
+        with pytest.raises(AttributeError):
+            await client.list_systems()
+
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_list_systems_small_chunked_body_cached(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a small body sent without a Content-Length is still cached."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            stream=IteratorStream([_SYSTEMS_BODY[:100], _SYSTEMS_BODY[100:]]),
+        )
+
+        first = await client.list_systems()
+        second = await client.list_systems()
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert [s.id for s in first] == [s.id for s in second] == ["sys1", "sys2"]
+
+    @pytest.mark.asyncio
+    async def test_get_many_system_details(
+        self, client: PulsewayClient, routes: dict[str, bytes]
+    ) -> None:
+        """Test fetching details for several systems concurrently."""
+        routes["/api/v1/systems/sys1"] = _SYSTEM_DETAILS_BODY
+
+        results = await client.get_many_system_details(["sys1", "missing"], concurrency=2)
+
+        assert len(results) == 2
+        assert isinstance(results[0], SystemDetails)
+        assert results[0].cpu_usage == 45.5
+        assert isinstance(results[1], APIError)
+        assert results[1].status_code == 404
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_get_many_system_details_rejects_bad_concurrency(
+        self, client: PulsewayClient, concurrency: int
+    ) -> None:
+        """Test that a concurrency below one is rejected instead of deadlocking."""
+        with pytest.raises(ValueError, match="concurrency"):
+            await client.get_many_system_details(["sys1"], concurrency=concurrency)
+
+    @pytest.mark.asyncio
+    async def test_request_headers(self, client: PulsewayClient, httpx_mock: HTTPXMock) -> None:
+        """Test that requests carry the auth and content headers."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/health",
+            json={"status": "ok"},
+        )
+
+        await client.health_check()
+
+        request = httpx_mock.get_requests()[0]
+        assert request.headers["Authorization"] == "Bearer test_token_id:test_token_secret"
+        assert request.headers["Accept"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation(
+        self,
+        client: PulsewayClient,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that expired cache entries are revalidated with If-None-Match."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/organizations",
+            content=_ORGS_BODY,
+            headers={**_JSON_HEADERS, "ETag": '"orgs-v1"'},
+        )
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            content=_SYSTEMS_BODY,
+            headers={**_JSON_HEADERS, "ETag": '"systems-v1"'},
+        )
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/organizations",
+            match_headers={"If-None-Match": '"orgs-v1"'},
+            status_code=304,
+        )
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            match_headers={"If-None-Match": '"systems-v1"'},
+            status_code=304,
+        )
+
+        await client.list_organizations()
+        await client.list_systems()
+
+        # Expire every entry without waiting for the real TTLs
+        now = time.monotonic() + 3600
+        monkeypatch.setattr(client._cache, "clock", lambda: now)
+
+        organizations = await client.list_organizations()
+        systems = await client.list_systems()
+
+        assert len(httpx_mock.get_requests()) == 4
+        assert [o.id for o in organizations] == ["org1", "org2"]
+        assert [s.id for s in systems] == ["sys1", "sys2"]
+
+    @pytest.mark.asyncio
+    async def test_list_results_are_frozen(
+        self, client: PulsewayClient, routes: dict[str, bytes]
+    ) -> None:
+        """Test that parsed models cannot be mutated once returned."""
+        routes["/api/v1/systems"] = _SYSTEMS_BODY
+
+        systems = await client.list_systems()
+
+        with pytest.raises(ValidationError):
+            systems[0].name = "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_get_system_metrics(self, client: PulsewayClient, httpx_mock: HTTPXMock) -> None:
+        """Test getting system metrics."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems/sys1/metrics/cpu",
+            json={
+                "unit": "%",
+                "metrics": [
+                    {"timestamp": "2025-01-01T12:00:00Z", "value": 12.5},
+                    {"timestamp": "2025-01-01T12:05:00Z", "value": 40},
+                    {"timestamp": "2025-01-01T12:10:00Z", "value": None},
+                    {"timestamp": "2025-01-01T12:12:00Z", "value": "n/a"},
+                    {"timestamp": "2025-01-01T12:13:00Z", "value": 30, "unit": None},
+                    {"timestamp": "2025-01-01T12:15:00Z", "value": 55.0, "unit": "percent"},
+                ],
+            },
+        )
+
+        metrics = await client.get_system_metrics("sys1", "cpu")
+
+        assert metrics.metric_type == MetricType.CPU
+        assert [m.value for m in metrics.metrics] == [12.5, 40.0, 30.0, 55.0]
+        assert metrics.metrics[0].unit == "%"
+        assert metrics.metrics[2].unit == "%"
+        assert metrics.metrics[-1].unit == "percent"
+        assert metrics.period_start == metrics.metrics[0].timestamp
+        assert metrics.period_end == metrics.metrics[-1].timestamp
+
+    @pytest.mark.asyncio
+    async def test_list_systems_validates_rows(
+        self, client: PulsewayClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that malformed rows are rejected by bulk validation."""
+        httpx_mock.add_response(
+            url="https://test.pulseway.com/api/v1/systems",
+            json={"systems": [{"id": "sys1", "name": ["not", "a", "string"]}]},
+        )
+
+        with pytest.raises(ValidationError):
+            await client.list_systems()
@@ -1,97 +1,135 @@
 """Tests for the MCP server."""
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
+from pulseway_mcp.client import PulsewayClient
 from pulseway_mcp.models import (
+    Metric,
+    MetricType,
     Notification,
     NotificationStatus,
     Organization,
     SystemDetails,
     SystemInfo,
+    SystemMetrics,
     SystemStatus,
 )
-from pulseway_mcp.server import call_tool, list_resources, list_tools
+from pulseway_mcp.server import (
+    MAX_BULK_SYSTEMS,
+    app,
+    call_tool,
+    list_resources,
+    list_tools,
+    main,
+)
 
+_FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
 
-@pytest.fixture
-def mock_client() -> MagicMock:
-    """Create a mock Pulseway client."""
-    client = MagicMock()
-    client.__aenter__ = AsyncMock(return_value=client)
-    client.__aexit__ = AsyncMock(return_value=None)
-    return client
+# Hard-coded, known-valid mock data built once with model_construct, which
+# skips pydantic validation.
+_MOCK_SYSTEMS = [
+    SystemInfo.model_construct(
+        id="sys1",
+        name="Server 1",
+        status=SystemStatus.ONLINE,
+        organization_id="org1",
+        ip_address="192.168.1.100",
+        operating_system="Windows Server 2022",
+    ),
+    SystemInfo.model_construct(
+        id="sys2",
+        name="Server 2",
+        status=SystemStatus.OFFLINE,
+        organization_id="org1",
+        ip_address="192.168.1.101",
+        operating_system="Ubuntu 22.04",
+    ),
+]
+
+_MOCK_DETAILS = SystemDetails.model_construct(
+    id="sys1",
+    name="Server 1",
+    status=SystemStatus.ONLINE,
+    organization_id="org1",
+    ip_address="192.168.1.100",
+    operating_system="Windows Server 2022",
+    cpu_usage=45.5,
+    memory_usage=62.3,
+    disk_usage=78.1,
+    uptime=86400,
+    notifications_count=3,
+)
+
+_MOCK_NOTIFS = [
+    Notification.model_construct(
+        id="notif1",
+        system_id="sys1",
+        title="High CPU Usage",
+        message="CPU usage exceeded 80%",
+        severity="warning",
+        status=NotificationStatus.ACTIVE,
+        timestamp=_FIXED_NOW,
+    ),
+]
+
+_MOCK_ORGS = [
+    Organization.model_construct(
+        id="org1",
+        name="Organization 1",
+        description="Test organization",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def _base_client() -> AsyncMock:
+    """Create the mock Pulseway client once per module."""
+    return AsyncMock(spec=PulsewayClient)
 
 
 @pytest.fixture
+def mock_client(_base_client: AsyncMock) -> AsyncMock:
+    """Provide the shared mock client with its call history and results reset."""
+    _base_client.reset_mock(return_value=True, side_effect=True)
+    _base_client.__aenter__.return_value = _base_client
+    _base_client.__aexit__.return_value = None
+    return _base_client
+
+
+@pytest.fixture(autouse=True)
+def _patched_get_client(monkeypatch: pytest.MonkeyPatch, mock_client: AsyncMock) -> None:
+    """Make the server's tool handlers use the mock client."""
+    monkeypatch.setattr("pulseway_mcp.server.get_client", lambda: mock_client)
+
+
+@pytest.fixture(scope="module")
 def mock_systems() -> list[SystemInfo]:
     """Create mock system data."""
-    return [
-        SystemInfo(
-            id="sys1",
-            name="Server 1",
-            status=SystemStatus.ONLINE,
-            organization_id="org1",
-            ip_address="192.168.1.100",
-            operating_system="Windows Server 2022",
-        ),
-        SystemInfo(
-            id="sys2",
-            name="Server 2",
-            status=SystemStatus.OFFLINE,
-            organization_id="org1",
-            ip_address="192.168.1.101",
-            operating_system="Ubuntu 22.04",
-        ),
-    ]
+    return _MOCK_SYSTEMS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_system_details() -> SystemDetails:
     """Create mock system details."""
-    return SystemDetails(
-        id="sys1",
-        name="Server 1",
-        status=SystemStatus.ONLINE,
-        organization_id="org1",
-        ip_address="192.168.1.100",
-        operating_system="Windows Server 2022",
-        cpu_usage=45.5,
-        memory_usage=62.3,
-        disk_usage=78.1,
-        uptime=86400,
-        notifications_count=3,
-    )
+    return _MOCK_DETAILS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_notifications() -> list[Notification]:
     """Create mock notifications."""
-    from datetime import datetime
-
-    return [
-        Notification(
-            id="notif1",
-            system_id="sys1",
-            title="High CPU Usage",
-            message="CPU usage exceeded 80%",
-            severity="warning",
-            status=NotificationStatus.ACTIVE,
-            timestamp=datetime.now(),
-        ),
-    ]
+    return _MOCK_NOTIFS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_organizations() -> list[Organization]:
     """Create mock organizations."""
-    return [
-        Organization(
-            id="org1",
-            name="Organization 1",
-            description="Test organization",
-        ),
-    ]
+    return _MOCK_ORGS
 
 
 class TestMCPServer:
@@ -115,104 +153,225 @@ class TestMCPServer:
         tool_names = [t.name for t in tools]
         assert "list_systems" in tool_names
         assert "get_system_details" in tool_names
+        assert "get_systems_details_bulk" in tool_names
         assert "get_system_notifications" in tool_names
         assert "list_organizations" in tool_names
         assert "get_system_metrics" in tool_names
+        assert await list_tools() is tools  # built once at import
 
     @pytest.mark.asyncio
-    async def test_call_tool_list_systems(
-        self, mock_client: MagicMock, mock_systems: list[SystemInfo]
+    @pytest.mark.parametrize(
+        ("tool", "args", "attr", "ret", "expected"),
+        [
+            pytest.param(
+                "list_systems",
+                {},
+                "list_systems",
+                "mock_systems",
+                ["sys1", "sys2"],
+                id="list_systems",
+            ),
+            pytest.param(
+                "get_system_details",
+                {"system_id": "sys1"},
+                "get_system_details",
+                "mock_system_details",
+                ["sys1", "45.5"],  # CPU usage
+                id="get_system_details",
+            ),
+            pytest.param(
+                "get_system_notifications",
+                {"system_id": "sys1", "status": "active"},
+                "get_system_notifications",
+                "mock_notifications",
+                ["notif1", "High CPU Usage"],
+                id="get_system_notifications",
+            ),
+            pytest.param(
+                "list_organizations",
+                {},
+                "list_organizations",
+                "mock_organizations",
+                ["org1", "Organization 1"],
+                id="list_organizations",
+            ),
+        ],
+    )
+    async def test_call_tool(
+        self,
+        request: pytest.FixtureRequest,
+        mock_client: AsyncMock,
+        tool: str,
+        args: dict,
+        attr: str,
+        ret: str,
+        expected: list[str],
     ) -> None:
-        """Test calling list_systems tool."""
-        mock_client.list_systems = AsyncMock(return_value=mock_systems)
+        """Test calling each tool against mocked client results."""
+        getattr(mock_client, attr).return_value = request.getfixturevalue(ret)
 
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool("list_systems", {})
+        result = await call_tool(tool, args)
 
         assert len(result) == 1
-        assert "sys1" in str(result[0].text)
-        assert "sys2" in str(result[0].text)
+        text = result[0].text
+        for substring in expected:
+            assert substring in text
+
+    @pytest.mark.asyncio
+    async def test_call_tool_returns_json(
+        self, mock_client: AsyncMock, mock_systems: list[SystemInfo]
+    ) -> None:
+        """Test that tool results are valid JSON."""
+        mock_client.list_systems.return_value = mock_systems
+
+        result = await call_tool("list_systems", {})
+
+        data = json.loads(result[0].text)
+        assert data["count"] == 2
+        assert data["systems"][0]["id"] == "sys1"
+        assert data["systems"][0]["status"] == "online"
+        assert data["systems"][0]["last_seen"] is None
 
     @pytest.mark.asyncio
     async def test_call_tool_list_systems_with_filters(
-        self, mock_client: MagicMock, mock_systems: list[SystemInfo]
+        self, mock_client: AsyncMock, mock_systems: list[SystemInfo]
     ) -> None:
         """Test calling list_systems tool with filters."""
-        mock_client.list_systems = AsyncMock(return_value=[mock_systems[0]])
+        mock_client.list_systems.return_value = [mock_systems[0]]
 
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool(
-                "list_systems",
-                {"organization_id": "org1", "online_only": True},
-            )
+        result = await call_tool(
+            "list_systems",
+            {"organization_id": "org1", "online_only": True},
+        )
 
         assert len(result) == 1
-        mock_client.list_systems.assert_called_once_with(
-            organization_id="org1", online_only=True
-        )
+        assert mock_client.list_systems.call_count == 1
+        assert mock_client.list_systems.call_args.kwargs == {
+            "organization_id": "org1",
+            "online_only": True,
+        }
 
     @pytest.mark.asyncio
-    async def test_call_tool_get_system_details(
-        self, mock_client: MagicMock, mock_system_details: SystemDetails
+    async def test_call_tool_get_systems_details_bulk(
+        self, mock_client: AsyncMock, mock_system_details: SystemDetails
     ) -> None:
-        """Test calling get_system_details tool."""
-        mock_client.get_system_details = AsyncMock(return_value=mock_system_details)
+        """Test calling get_systems_details_bulk tool."""
+        mock_client.get_many_system_details.return_value = [
+            mock_system_details,
+            Exception("Not found"),
+        ]
 
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool("get_system_details", {"system_id": "sys1"})
+        result = await call_tool("get_systems_details_bulk", {"system_ids": ["sys1", "missing"]})
 
         assert len(result) == 1
-        assert "sys1" in str(result[0].text)
-        assert "45.5" in str(result[0].text)  # CPU usage
+        data = json.loads(result[0].text)
+        assert data["count"] == 1
+        assert data["systems"][0]["cpu_usage"] == 45.5
+        assert data["errors"] == [{"system_id": "missing", "error": "Not found"}]
 
     @pytest.mark.asyncio
-    async def test_call_tool_get_system_notifications(
-        self, mock_client: MagicMock, mock_notifications: list[Notification]
+    async def test_call_tool_get_systems_details_bulk_dedupes(
+        self, mock_client: AsyncMock, mock_system_details: SystemDetails
     ) -> None:
-        """Test calling get_system_notifications tool."""
-        mock_client.get_system_notifications = AsyncMock(return_value=mock_notifications)
+        """Test that repeated system IDs are only fetched once."""
+        mock_client.get_many_system_details.return_value = [mock_system_details]
 
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool(
-                "get_system_notifications",
-                {"system_id": "sys1", "status": "active"},
+        await call_tool("get_systems_details_bulk", {"system_ids": ["sys1", "sys1"]})
+
+        assert mock_client.get_many_system_details.call_args.args == (["sys1"],)
+
+    @pytest.mark.asyncio
+    async def test_call_tool_get_systems_details_bulk_limit(self, mock_client: AsyncMock) -> None:
+        """Test that oversized bulk requests are rejected without calling the API."""
+        system_ids = [f"sys{i}" for i in range(MAX_BULK_SYSTEMS + 1)]
+
+        result = await call_tool("get_systems_details_bulk", {"system_ids": system_ids})
+
+        assert result[0].text.startswith("Error: ")
+        mock_client.get_many_system_details.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_formats_timestamps(self, mock_client: AsyncMock) -> None:
+        """Test that datetimes in tool results are emitted as ISO 8601 strings."""
+        timestamp = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        mock_client.get_system_notifications.return_value = [
+            Notification(
+                id=f"notif{i}",
+                system_id="sys1",
+                title="Batch event",
+                message="Shared timestamp",
+                severity="info",
+                status=NotificationStatus.ACKNOWLEDGED,
+                timestamp=timestamp,
+                acknowledged_at=timestamp,
             )
+            for i in range(3)
+        ]
 
-        assert len(result) == 1
-        assert "notif1" in str(result[0].text)
-        assert "High CPU Usage" in str(result[0].text)
+        result = await call_tool("get_system_notifications", {"system_id": "sys1"})
+
+        data = json.loads(result[0].text)
+        for notification in data["notifications"]:
+            assert notification["timestamp"] == "2025-01-01T12:00:00+00:00"
+            assert notification["acknowledged_at"] == "2025-01-01T12:00:00+00:00"
 
     @pytest.mark.asyncio
-    async def test_call_tool_list_organizations(
-        self, mock_client: MagicMock, mock_organizations: list[Organization]
-    ) -> None:
-        """Test calling list_organizations tool."""
-        mock_client.list_organizations = AsyncMock(return_value=mock_organizations)
+    async def test_call_tool_get_system_metrics(self, mock_client: AsyncMock) -> None:
+        """Test calling get_system_metrics tool."""
+        mock_client.get_system_metrics.return_value = SystemMetrics(
+            system_id="sys1",
+            metric_type=MetricType.MEMORY,
+            metrics=[Metric(timestamp=_FIXED_NOW, value=62.3, unit="%")],
+            period_start=_FIXED_NOW,
+            period_end=_FIXED_NOW,
+        )
 
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool("list_organizations", {})
+        result = await call_tool(
+            "get_system_metrics", {"system_id": "sys1", "metric_type": "memory"}
+        )
 
-        assert len(result) == 1
-        assert "org1" in str(result[0].text)
-        assert "Organization 1" in str(result[0].text)
+        assert mock_client.get_system_metrics.call_args.args == ("sys1", "memory")
+        data = json.loads(result[0].text)
+        assert data["metric_type"] == "memory"
+        assert data["period_start"] == "2025-01-01T12:00:00+00:00"
+        assert data["metrics"] == [
+            {"timestamp": "2025-01-01T12:00:00+00:00", "value": 62.3, "unit": "%"}
+        ]
 
     @pytest.mark.asyncio
-    async def test_call_tool_unknown(self, mock_client: MagicMock) -> None:
+    async def test_call_tool_unknown(self, mock_client: AsyncMock) -> None:
         """Test calling unknown tool."""
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool("unknown_tool", {})
+        result = await call_tool("unknown_tool", {})
 
         assert len(result) == 1
-        assert "Error" in str(result[0].text)
+        assert result[0].text == "Error: Unknown tool: unknown_tool"
 
     @pytest.mark.asyncio
-    async def test_call_tool_error_handling(self, mock_client: MagicMock) -> None:
+    async def test_call_tool_error_handling(self, mock_client: AsyncMock) -> None:
         """Test error handling in tool calls."""
-        mock_client.list_systems = AsyncMock(side_effect=Exception("API Error"))
+        mock_client.list_systems.side_effect = Exception("API Error")
 
-        with patch("pulseway_mcp.server.get_client", return_value=mock_client):
-            result = await call_tool("list_systems", {})
+        result = await call_tool("list_systems", {})
 
         assert len(result) == 1
-        assert "Error" in str(result[0].text)
-        assert "API Error" in str(result[0].text)
+        assert result[0].text == "Error: API Error"
+
+    @pytest.mark.asyncio
+    async def test_main_survives_failed_warmup(
+        self, mock_client: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that startup reaches the MCP transport even if the warm-up raises."""
+        mock_client.health_check.side_effect = ValueError("not JSON")
+
+        @asynccontextmanager
+        async def fake_stdio_server() -> AsyncIterator[tuple[None, None]]:
+            yield None, None
+
+        run = AsyncMock()
+        monkeypatch.setattr("pulseway_mcp.server.stdio_server", fake_stdio_server)
+        monkeypatch.setattr(app, "run", run)
+
+        await main()
+
+        run.assert_awaited_once()
+        mock_client.aclose.assert_awaited_once()